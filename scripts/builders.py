@@ -1,12 +1,14 @@
-import copy
-from functools import lru_cache
+import json
+from contextlib import closing
+from functools import cached_property, lru_cache
 from typing import Any
+from urllib.parse import urlencode
 
 import github_action_utils as gha_utils  # type: ignore
 import requests
 
-from .config import MARKDOWN_FILE, ActionEnvironment, Configuration
-from .utils import get_request_headers
+from .config import MARKDOWN_FILE, PULL_REQUEST, ActionEnvironment, Configuration
+from .utils import get_request_session, json_loads
 
 
 class ChangelogBuilderBase:
@@ -26,6 +28,18 @@ class ChangelogBuilderBase:
 
         self.changelog_string = ""
         self.change_list: list[dict[str, Any]] = []
+        # Stores the `ETag` and data of the GitHub API responses
+        # so that unchanged responses are not downloaded again,
+        # only used if `response_cache_file` is provided
+        self._response_cache: dict[str, dict[str, Any]] | None = None
+        # responses used in this run, only these are written back
+        # so that the cache does not grow with outdated URLs
+        self._used_response_cache: dict[str, dict[str, Any]] = {}
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        """Session reused for all the GitHub API requests, created on first use"""
+        return get_request_session(self.config.github_token)
 
     @staticmethod
     def _get_changelog_line(file_type: str, item: dict[str, Any]) -> str:
@@ -36,11 +50,97 @@ class ChangelogBuilderBase:
         """Get changes list after last release"""
         raise NotImplementedError
 
+    def _get_changelog_header(self, file_type: str) -> str:
+        """Generate the version header of the changelog"""
+        header = f"{self.config.header_prefix} {self.release_version}"
+
+        if file_type == MARKDOWN_FILE:
+            return f"# {header}\n\n"
+
+        return f"{header}\n{'=' * len(header)}\n\n"
+
     @lru_cache
     def parse_changelog(self, file_type: str) -> str:
         """Parse changelog, and build the changelog string (Markdown or ReStructuredText)"""
         raise NotImplementedError
 
+    def _get_response_cache(self) -> dict[str, dict[str, Any]]:
+        """Load the cached GitHub API responses from the cache file"""
+        if self._response_cache is None:
+            self._response_cache = {}
+
+            if self.config.response_cache_file:
+                try:
+                    with open(self.config.response_cache_file, "r") as file:
+                        response_cache = json_loads(file.read())
+                except (OSError, ValueError):
+                    # the cache is missing or corrupted, start with an empty one
+                    response_cache = {}
+
+                if isinstance(response_cache, dict):
+                    self._response_cache = response_cache
+
+        return self._response_cache
+
+    def _save_response_cache(self) -> None:
+        """Write the cached GitHub API responses to the cache file"""
+        if not self.config.response_cache_file or not self._used_response_cache:
+            return
+
+        try:
+            with open(self.config.response_cache_file, "w") as file:
+                json.dump(self._used_response_cache, file)
+        except OSError as e:
+            # the cache is optional, do not fail the run if it can not be written
+            gha_utils.warning(
+                f"Could not write the response cache file "
+                f"{self.config.response_cache_file}, error: {e}"
+            )
+
+    def _cached_get(self, url: str) -> tuple[int, Any, str | None]:
+        """
+        Send a conditional GET request to the GitHub API and return
+        the status code, the response data and the next page URL
+        """
+        cached_response = self._get_response_cache().get(url)
+        headers = {}
+
+        # the cache file is restored from outside of Changelog CI,
+        # treat invalid entries as cache misses
+        if not (
+            isinstance(cached_response, dict)
+            and isinstance(cached_response.get("etag"), str)
+            and "data" in cached_response
+        ):
+            cached_response = None
+
+        if cached_response:
+            headers["If-None-Match"] = cached_response["etag"]
+
+        response = self._session.get(url, headers=headers)
+
+        # API returns 304 Not Modified if the data has not changed
+        if response.status_code == 304 and cached_response:
+            self._used_response_cache[url] = cached_response
+            return 200, cached_response["data"], cached_response.get("next_url")
+
+        if response.status_code != 200:
+            return response.status_code, None, None
+
+        response_data = json_loads(response.content)
+        # paginated APIs return the next page URL in the `Link` header
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+
+        if etag and self.config.response_cache_file:
+            self._used_response_cache[url] = {
+                "etag": etag,
+                "data": response_data,
+                "next_url": next_url,
+            }
+
+        return response.status_code, response_data, next_url
+
     def _get_latest_release_date(self) -> str:
         """Using GitHub API gets the latest release date"""
         url = (
@@ -48,27 +148,28 @@ class ChangelogBuilderBase:
             f"{self.action_env.repository}/releases/latest"
         )
 
-        response = requests.get(
-            url, headers=get_request_headers(self.config.github_token)
-        )
+        status_code, response_data, _ = self._cached_get(url)
 
         published_date = ""
 
-        if response.status_code == 200:
-            response_data = response.json()
+        if status_code == 200:
             # get the published date of the latest release
             published_date = response_data["published_at"]
         else:
             # if there is no previous release API will return 404 Not Found
             gha_utils.warning(
                 f"Could not find any previous release for "
-                f"{self.action_env.repository}, status code: {response.status_code}"
+                f"{self.action_env.repository}, status code: {status_code}"
             )
         return published_date
 
     def build(self) -> str:
         """Generate the changelog"""
-        self.change_list = self._get_changes_after_last_release()
+        with closing(self._session):
+            self.change_list = self._get_changes_after_last_release()
+
+        # write the cache once after all the requests are done
+        self._save_response_cache()
 
         # exit the method if there is no changes found
         if not self.change_list:
@@ -82,223 +183,281 @@ class ChangelogBuilderBase:
 class PullRequestChangelogBuilder(ChangelogBuilderBase):
     """Changelog Builder that Uses Pull Request Titles to Generate the Changelog"""
 
+    # Fetches the merged pull requests 100 at a time,
+    # `after` is the cursor of the last page
+    PULL_REQUEST_SEARCH_QUERY: str = """
+        query($q: String!, $after: String) {
+          search(query: $q, type: ISSUE, first: 100, after: $after) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              ... on PullRequest {
+                number
+                title
+                url
+                labels(first: 20) {
+                  nodes {
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+
     @staticmethod
     def _get_changelog_line(file_type: str, item: dict[str, Any]) -> str:
         """Generate each line of the changelog"""
         if file_type == MARKDOWN_FILE:
-            changelog_line_template = "* [#{number}]({url}): {title}\n"
-        else:
-            changelog_line_template = "* `#{number} <{url}>`__: {title}\n"
+            return f"* [#{item['number']}]({item['url']}): {item['title']}\n"
 
-        return changelog_line_template.format(
-            number=item["number"], url=item["url"], title=item["title"]
-        )
+        return f"* `#{item['number']} <{item['url']}>`__: {item['title']}\n"
 
-    def _get_changes_after_last_release(self) -> list[dict[str, str | int | list[str]]]:
+    def _get_changes_after_last_release(
+        self,
+    ) -> list[dict[str, str | int | frozenset[str]]]:
         """Get all the merged pull request after latest release"""
-        previous_release_date = self._get_latest_release_date()
+        if not self.config.github_token:
+            # GitHub GraphQL API always requires authentication
+            gha_utils.error(
+                "`github_token` input is required to generate changelog "
+                f"using `changelog_type: {PULL_REQUEST}`. "
+                "Please add `github_token` to your workflow yaml file. "
+                "Look at Changelog CI's documentation for more information."
+            )
+            raise SystemExit(1)
 
-        if previous_release_date:
-            merged_date_filter = "merged:>=" + previous_release_date
-        else:
-            # if there is no release for the repo then
-            # do not filter by merged date
-            merged_date_filter = ""
+        previous_release_date = self._get_latest_release_date()
 
-        # Detail on the GitHub Search API:
-        # https://docs.github.com/en/rest/search#search-issues-and-pull-requests
+        # Detail on the GitHub GraphQL Search API:
+        # https://docs.github.com/en/graphql/reference/queries#search
         # https://docs.github.com/en/search-github/searching-on-github/searching-issues-and-pull-requests
         # https://docs.github.com/en/search-github/getting-started-with-searching-on-github/sorting-search-results
-        url = (
-            f"{self.GITHUB_API_URL}/search/issues"
-            f"?q=repo:{self.action_env.repository}+"
-            "is:pr+"
-            "is:merged+"
-            "sort:created-asc+"
-            f"{merged_date_filter}"
-            "&per_page=100"
-        )
-
-        items = []
-
-        response = requests.get(
-            url, headers=get_request_headers(self.config.github_token)
-        )
+        url = f"{self.GITHUB_API_URL}/graphql"
+        search_qualifiers = [
+            f"repo:{self.action_env.repository}",
+            "is:pr",
+            "is:merged",
+            "sort:created-asc",
+        ]
+
+        # if there is no release for the repo then
+        # do not filter by merged date
+        if previous_release_date:
+            # `published_at` is already an ISO 8601 date string,
+            # which the search syntax accepts as is
+            search_qualifiers.append(f"merged:>={previous_release_date}")
+
+        search_query = " ".join(search_qualifiers)
+
+        items: list[dict[str, str | int | frozenset[str]]] = []
+        cursor = None
+
+        while True:
+            response = self._session.post(
+                url,
+                json={
+                    "query": self.PULL_REQUEST_SEARCH_QUERY,
+                    "variables": {"q": search_query, "after": cursor},
+                },
+            )
 
-        if response.status_code == 200:
-            response_data = response.json()
+            response_data = (
+                json_loads(response.content) if response.status_code == 200 else {}
+            )
 
-            # `total_count` represents the number of
-            # pull requests returned by the API call
-            if response_data["total_count"] > 0:
-                for item in response_data["items"]:
-                    data = {
-                        "title": item["title"],
-                        "number": item["number"],
-                        "url": item["html_url"],
-                        "labels": [label["name"] for label in item["labels"]],
-                    }
-                    items.append(data)
-            else:
+            # GraphQL API returns errors with a 200 status code
+            if not response_data.get("data"):
                 gha_utils.error(
-                    f"There was no pull request "
-                    f"made on {self.action_env.repository} after last release."
+                    f"Could not get pull requests for "
+                    f"{self.action_env.repository} from GitHub API. "
+                    f"response status code: {response.status_code}, "
+                    f"errors: {response_data.get('errors')}"
                 )
-        else:
+                # exit instead of generating a changelog
+                # with only some of the pull requests
+                raise SystemExit(1)
+
+            search_data = response_data["data"]["search"]
+
+            for node in search_data["nodes"]:
+                data = {
+                    "title": node["title"],
+                    "number": node["number"],
+                    "url": node["url"],
+                    "labels": frozenset(
+                        label["name"] for label in node["labels"]["nodes"]
+                    ),
+                }
+                items.append(data)
+
+            if not search_data["pageInfo"]["hasNextPage"]:
+                break
+
+            cursor = search_data["pageInfo"]["endCursor"]
+
+        if not items:
             gha_utils.error(
-                f"Could not get pull requests for "
-                f"{self.action_env.repository} from GitHub API. "
-                f"response status code: {response.status_code}"
+                f"There was no pull request "
+                f"made on {self.action_env.repository} after last release."
             )
         return items
 
     @lru_cache
     def parse_changelog(self, file_type: str) -> str:
         """Parse the pull requests data and return a string (Markdown or ReStructuredText)"""
-        new_changes = copy.deepcopy(self.change_list)
-        header = f"{self.config.header_prefix} {self.release_version}"
-
-        if file_type == MARKDOWN_FILE:
-            changelog_string = f"# {header}\n\n"
-        else:
-            changelog_string = f"{header}\n{'=' * len(header)}\n\n"
+        changelog_string = self._get_changelog_header(file_type)
 
         group_config = self.config.group_config
-        exclude_labels = self.config.exclude_labels
+        exclude_labels = frozenset(self.config.exclude_labels)
 
         if not group_config:
             # If group config does not exist then append it without and groups
             changelog_string += "".join(
-                [self._get_changelog_line(file_type, item) for item in new_changes]
+                [self._get_changelog_line(file_type, item) for item in self.change_list]
             )
             return changelog_string
 
-        for config in group_config:
+        # map each label to the first group that contains it
+        # so that one item does not match multiple groups
+        label_to_group: dict[str, int] = {}
 
-            if len(new_changes) == 0:
-                break
+        for index, group in enumerate(group_config):
+            for label in group["labels"]:
+                label_to_group.setdefault(label, index)
 
-            items_string = ""
+        group_items: list[list[str]] = [[] for _ in group_config]
+        unlabeled_items: list[str] = []
 
-            pull_request_list = copy.deepcopy(new_changes)
+        for pull_request in self.change_list:
+            # check if the pull request label matches with
+            # any label of the `exclude_labels` list
+            if not exclude_labels.isdisjoint(pull_request["labels"]):
+                continue
 
-            for pull_request in pull_request_list:
-                # check if the pull request label matches with
-                # any label of the `exclude_labels` list
-                if any(label in pull_request["labels"] for label in exclude_labels):
-                    # if it matches then remove it from the list
-                    new_changes.remove(pull_request)
-                    continue
+            matched_groups = [
+                label_to_group[label]
+                for label in pull_request["labels"]
+                if label in label_to_group
+            ]
+            changelog_line = self._get_changelog_line(file_type, pull_request)
 
-                # check if the pull request label matches with
-                # any label of the config
-                if any(label in pull_request["labels"] for label in config["labels"]):
-                    items_string += self._get_changelog_line(file_type, pull_request)
-                    # remove the item so that one item
-                    # does not match multiple groups
-                    new_changes.remove(pull_request)
+            if matched_groups:
+                group_items[min(matched_groups)].append(changelog_line)
+            else:
+                unlabeled_items.append(changelog_line)
 
-            if items_string:
+        # collect all the parts and join them once at the end
+        changelog_parts = [changelog_string]
+
+        for group, items in zip(group_config, group_items):
+            if items:
                 if file_type == MARKDOWN_FILE:
-                    changelog_string += f"\n#### {config['title']}\n\n"
+                    changelog_parts.append(f"\n#### {group['title']}\n\n")
                 else:
-                    changelog_string += (
-                        f"\n{config['title']}\n {'-' * len(config['title'])}\n\n"
+                    changelog_parts.append(
+                        f"\n{group['title']}\n{'-' * len(group['title'])}\n\n"
                     )
-                changelog_string += items_string
+                changelog_parts.extend(items)
 
-        if new_changes and self.config.include_unlabeled_changes:
+        if unlabeled_items and self.config.include_unlabeled_changes:
+            unlabeled_group_title = self.config.unlabeled_group_title
             # if they do not match any user provided group
             # Add items in `unlabeled group` group
             if file_type == MARKDOWN_FILE:
-                changelog_string += f"\n#### {self.config.unlabeled_group_title}\n\n"
+                changelog_parts.append(f"\n#### {unlabeled_group_title}\n\n")
             else:
-                changelog_string += (
-                    f"\n{self.config.unlabeled_group_title}\n"
-                    f"{'-' * len(self.config.unlabeled_group_title)}\n\n"
+                changelog_parts.append(
+                    f"\n{unlabeled_group_title}\n"
+                    f"{'-' * len(unlabeled_group_title)}\n\n"
                 )
-            changelog_string += "".join(
-                [self._get_changelog_line(file_type, item) for item in new_changes]
-            )
+            changelog_parts.extend(unlabeled_items)
 
-        return changelog_string
+        return "".join(changelog_parts)
 
 
 class CommitMessageChangelogBuilder(ChangelogBuilderBase):
     """Changelog Builder that Uses Commit Messages to Generate the Changelog"""
 
+    # Commit messages starting with these prefixes are merge commits
+    MERGE_COMMIT_PREFIXES: tuple[str, ...] = ("Merge pull request #", "Merge branch")
+
     @staticmethod
     def _get_changelog_line(file_type: str, item: dict[str, Any]) -> str:
         """Generate each line of the changelog"""
         if file_type == MARKDOWN_FILE:
-            changelog_line_template = "* [{sha}]({url}): {message}\n"
-        else:
-            changelog_line_template = "* `{sha} <{url}>`__: {message}\n"
+            return f"* [{item['sha'][:7]}]({item['url']}): {item['message']}\n"
 
-        return changelog_line_template.format(
-            sha=item["sha"][:7], url=item["url"], message=item["message"]
-        )
+        return f"* `{item['sha'][:7]} <{item['url']}>`__: {item['message']}\n"
 
     def _get_changes_after_last_release(self) -> list[dict[str, str]]:
         """Get all the merged pull request after latest release"""
         # Detail on the GitHub Commits API:
         # https://docs.github.com/en/rest/commits/commits#list-commits
-        url = f"{self.GITHUB_API_URL}/repos/{self.action_env.repository}/commits?per_page=100"
+        query_params: dict[str, str | int] = {"per_page": 100}
         previous_release_date = self._get_latest_release_date()
 
         if previous_release_date:
-            url = f"{url}&since={previous_release_date}"
-
-        items = []
+            query_params["since"] = previous_release_date
 
-        response = requests.get(
-            url, headers=get_request_headers(self.config.github_token)
+        url: str | None = (
+            f"{self.GITHUB_API_URL}/repos/{self.action_env.repository}/commits"
+            f"?{urlencode(query_params)}"
         )
 
-        if response.status_code == 200:
-            response_data = response.json()
-
-            if len(response_data) > 0:
-                for item in response_data:
-                    message = item["commit"]["message"]
-                    # Exclude merge commit
-                    if not (
-                        message.startswith("Merge pull request #")
-                        or message.startswith("Merge branch")
-                    ):
-                        data = {
-                            "sha": item["sha"],
-                            "message": message,
-                            "url": item["html_url"],
-                        }
-                        items.append(data)
-                    else:
-                        gha_utils.notice(f'Skipping Merge Commit "{message}"')
-            else:
+        items: list[dict[str, str]] = []
+        commit_count = 0
+
+        # follow the `next` page links until all the commits are fetched
+        while url:
+            status_code, response_data, url = self._cached_get(url)
+
+            if status_code != 200:
                 gha_utils.error(
-                    f"There was no commit "
-                    f"made on {self.action_env.repository} after last release."
+                    f"Could not get commits for "
+                    f"{self.action_env.repository} from GitHub API. "
+                    f"response status code: {status_code}"
                 )
-        else:
+                # exit instead of generating a changelog
+                # with only some of the commits
+                raise SystemExit(1)
+
+            if not previous_release_date:
+                # if there is no release for the repo then only use the
+                # latest 100 commits instead of the whole commit history
+                url = None
+
+            commit_count += len(response_data)
+
+            for item in response_data:
+                message = item["commit"]["message"]
+                # Exclude merge commit
+                if not message.startswith(self.MERGE_COMMIT_PREFIXES):
+                    data = {
+                        "sha": item["sha"],
+                        "message": message,
+                        "url": item["html_url"],
+                    }
+                    items.append(data)
+                else:
+                    gha_utils.notice(f'Skipping Merge Commit "{message}"')
+
+        if commit_count == 0:
             gha_utils.error(
-                f"Could not get commits for "
-                f"{self.action_env.repository} from GitHub API. "
-                f"response status code: {response.status_code}"
+                f"There was no commit "
+                f"made on {self.action_env.repository} after last release."
             )
         return items
 
     @lru_cache
     def parse_changelog(self, file_type: str) -> str:
         """Parse the commit data and return a string (Markdown or ReStructuredText)"""
-        new_changes = copy.deepcopy(self.change_list)
-        header = f"{self.config.header_prefix} {self.release_version}"
-
-        if file_type == MARKDOWN_FILE:
-            changelog_string = f"# {header}\n\n"
-        else:
-            changelog_string = f"{header}\n{'=' * len(header)}\n\n"
+        changelog_string = self._get_changelog_header(file_type)
         changelog_string += "".join(
-            [self._get_changelog_line(file_type, item) for item in new_changes]
+            [self._get_changelog_line(file_type, item) for item in self.change_list]
         )
 
         return changelog_string
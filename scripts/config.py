@@ -1,10 +1,11 @@
-import json
 import re
 from typing import Any, Callable, Mapping, NamedTuple, TextIO
 
 import github_action_utils as gha_utils  # type: ignore
 import yaml
 
+from .utils import json_load, json_loads
+
 # Changelog Types
 PULL_REQUEST: str = "pull_request"
 COMMIT_MESSAGE: str = "commit_message"
@@ -13,6 +14,9 @@ COMMIT_MESSAGE: str = "commit_message"
 MARKDOWN_FILE: str = "md"
 RESTRUCTUREDTEXT_FILE: str = "rst"
 
+# Values accepted for boolean configuration options
+BOOLEAN_VALUES: tuple[int | bool, ...] = (0, 1, False, True)
+
 
 UserConfigType = dict[str, str | bool | list[dict[str, str | list[str]]] | None]
 
@@ -27,13 +31,19 @@ class ActionEnvironment(NamedTuple):
 
     @classmethod
     def from_env(cls, env: Mapping[str, str]) -> "ActionEnvironment":
+        event_path = env["GITHUB_EVENT_PATH"]
+
+        # parse the event payload only once, it is reused for the whole run
+        with open(event_path, "rb") as file:
+            event_payload = json_loads(file.read())
+
         return cls(
-            event_path=env["GITHUB_EVENT_PATH"],
+            event_path=event_path,
             repository=env["GITHUB_REPOSITORY"],
             pull_request_branch=env["GITHUB_HEAD_REF"],
             base_branch=env["GITHUB_REF"],
             event_name=env["GITHUB_EVENT_NAME"],
-            event_payload=gha_utils.event_payload(),
+            event_payload=event_payload,
         )
 
 
@@ -65,6 +75,7 @@ class Configuration(NamedTuple):
     git_committer_email: str = "github-actions[bot]@users.noreply.github.com"
     release_version: str | None = None
     github_token: str | None = None
+    response_cache_file: str | None = None
 
     @property
     def changelog_file_type(self) -> str:
@@ -99,6 +110,7 @@ class Configuration(NamedTuple):
             "git_committer_email": env.get("INPUT_COMMITTER_EMAIL"),
             "release_version": env.get("INPUT_RELEASE_VERSION"),
             "github_token": env.get("INPUT_GITHUB_TOKEN"),
+            "response_cache_file": env.get("INPUT_RESPONSE_CACHE_FILE"),
         }
         config_file_path = env.get("INPUT_CONFIG_FILE")
 
@@ -125,12 +137,12 @@ class Configuration(NamedTuple):
         try:
             # parse config files with the extension .yml and .yaml
             # using YAML syntax
-            if config_file_path.endswith("yml") or config_file_path.endswith("yaml"):
+            if config_file_path.endswith(("yml", "yaml")):
                 loader = yaml.safe_load
             # parse config files with the extension .json
             # using JSON syntax
             elif config_file_path.endswith("json"):
-                loader = json.load
+                loader = json_load
             else:
                 gha_utils.error(
                     "We only support `JSON` or `YAML` file for configuration "
@@ -141,7 +153,8 @@ class Configuration(NamedTuple):
             with open(config_file_path, "r") as file:
                 config_file_data = loader(file)
 
-        except Exception as e:
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            # `ValueError` covers JSON decode errors and invalid file encoding
             gha_utils.error(
                 f"Invalid Configuration file, error: {e}, "
                 "falling back to default configuration to parse changelog"
@@ -157,11 +170,11 @@ class Configuration(NamedTuple):
 
         for key, value in user_config.items():
             if key in cls._fields:
-                cleand_value = getattr(cls, f"clean_{key.lower()}", lambda x: None)(
+                cleaned_value = getattr(cls, f"clean_{key.lower()}", lambda x: None)(
                     value
                 )
-                if cleand_value is not None:
-                    cleaned_user_config[key] = cleand_value
+                if cleaned_value is not None:
+                    cleaned_user_config[key] = cleaned_value
 
         return cleaned_user_config
 
@@ -179,7 +192,7 @@ class Configuration(NamedTuple):
     @classmethod
     def clean_commit_changelog(cls, value: Any) -> bool | None:
         """clean commit_changelog configuration option"""
-        if value not in [0, 1, False, True]:
+        if value not in BOOLEAN_VALUES:
             gha_utils.warning(
                 "`commit_changelog` was not provided or not valid, "
                 "falling back to default value."
@@ -190,7 +203,7 @@ class Configuration(NamedTuple):
     @classmethod
     def clean_comment_changelog(cls, value: Any) -> bool | None:
         """clean comment_changelog configuration option"""
-        if value not in [0, 1, False, True]:
+        if value not in BOOLEAN_VALUES:
             gha_utils.warning(
                 "`comment_changelog` was not provided or not valid, "
                 "falling back to default value."
@@ -212,7 +225,7 @@ class Configuration(NamedTuple):
             # This will raise an error if the provided regex is not valid
             re.compile(value)
             return value
-        except Exception:
+        except (re.error, TypeError):
             gha_utils.error(
                 "`pull_request_title_regex` is not valid, "
                 "Falling back to default value."
@@ -232,7 +245,7 @@ class Configuration(NamedTuple):
             # This will raise an error if the provided regex is not valid
             re.compile(value)
             return value
-        except Exception:
+        except (re.error, TypeError):
             gha_utils.warning(
                 "`version_regex` is not valid, Falling back to default value."
             )
@@ -255,7 +268,7 @@ class Configuration(NamedTuple):
     @classmethod
     def clean_include_unlabeled_changes(cls, value: Any) -> bool | None:
         """clean include_unlabeled_changes configuration option"""
-        if value not in [0, 1, False, True]:
+        if value not in BOOLEAN_VALUES:
             gha_utils.warning(
                 "`include_unlabeled_changes` was not provided or not valid, "
                 "falling back to default value."
@@ -278,11 +291,7 @@ class Configuration(NamedTuple):
     @classmethod
     def clean_changelog_filename(cls, value: Any) -> str | None:
         """clean changelog_filename item configuration option"""
-        if (
-            value
-            and isinstance(value, str)
-            and (value.endswith(".md") or value.endswith(".rst"))
-        ):
+        if value and isinstance(value, str) and value.endswith((".md", ".rst")):
             return value
         else:
             gha_utils.warning(
@@ -335,6 +344,15 @@ class Configuration(NamedTuple):
             gha_utils.notice("`github_token` was not provided as an input.")
             return None
 
+    @classmethod
+    def clean_response_cache_file(cls, value: Any) -> str | None:
+        """clean response_cache_file item configuration option"""
+        if value and isinstance(value, str):
+            return value
+        else:
+            gha_utils.notice("`response_cache_file` was not provided as an input.")
+            return None
+
     @classmethod
     def clean_exclude_labels(cls, value: Any) -> list[str] | None:
         """clean exclude_labels item configuration option"""
@@ -1,7 +1,9 @@
 import abc
 import os
 import re
+import shutil
 import time
+from contextlib import suppress
 from typing import Any
 
 import github_action_utils as gha_utils  # type: ignore
@@ -26,44 +28,38 @@ from .run_git import (
     create_new_git_branch,
     git_commit_changelog,
 )
-from .utils import display_whats_new, get_request_headers
+from .utils import display_whats_new, get_request_headers, json_loads
 
 
 class ChangelogCIBase(abc.ABC):
     """Base Class for Changelog CI"""
 
     GITHUB_API_URL: str = "https://api.github.com"
+    FILE_CHUNK_SIZE: int = 64 * 1024
 
     def __init__(self, config: Configuration, action_env: ActionEnvironment) -> None:
         self.config = config
         self.action_env = action_env
         self.event_payload = self.action_env.event_payload
 
+        # Runs before anything else is prepared,
+        # so that Changelog CI can exit early if needed
+        self._pre_init_check()
+
         self.release_version = self._get_release_version()
         self.builder: ChangelogBuilderBase = self._get_changelog_builder(
             config, action_env, self.release_version
         )
 
-    @property
-    def _open_file_mode(self) -> str:
-        """Gets the mode that the changelog file should be opened in"""
-        if os.path.exists(self.config.changelog_filename):
-            # if the changelog file exists
-            # opens it in read-write mode
-            file_mode = "r+"
-        else:
-            # if the changelog file does not exist
-            # opens it in read-write mode
-            # but creates the file first also
-            file_mode = "w+"
-
-        return file_mode
-
     @property
     def _comment_issue_number(self) -> Any:
         """Issue number to comment on"""
         return None
 
+    def _pre_init_check(self) -> None:
+        """Check if changelog should be generated before initializing"""
+        pass
+
     @property
     @abc.abstractmethod
     def _commit_branch_name(self) -> str:
@@ -89,17 +85,42 @@ class ChangelogCIBase(abc.ABC):
 
     def _update_changelog_file(self, string_data: str) -> None:
         """Write changelog to the changelog file"""
-        with open(self.config.changelog_filename, self._open_file_mode) as f:
-            # read the existing data and store it in a variable
-            body = f.read()
-            # write at the top of the file
-            f.seek(0, 0)
-            f.write(string_data)
-
-            if body:
-                # re-write the existing data
-                f.write("\n\n")
-                f.write(body)
+        changelog_filename = self.config.changelog_filename
+        temp_filename = f"{changelog_filename}.tmp"
+
+        try:
+            with open(temp_filename, "w", buffering=self.FILE_CHUNK_SIZE) as temp_file:
+                # write at the top of the file
+                temp_file.write(string_data)
+
+                try:
+                    changelog_file = open(changelog_filename, "r")
+                except FileNotFoundError:
+                    # the changelog file will be created by `os.replace`
+                    pass
+                else:
+                    with changelog_file:
+                        body = changelog_file.read(self.FILE_CHUNK_SIZE)
+
+                        if body:
+                            # re-write the existing data in chunks
+                            # instead of loading the whole file in memory
+                            temp_file.write("\n\n")
+                            temp_file.write(body)
+                            shutil.copyfileobj(
+                                changelog_file, temp_file, self.FILE_CHUNK_SIZE
+                            )
+
+                    shutil.copymode(changelog_filename, temp_filename)
+
+            # replace the changelog file only after it has been fully written
+            os.replace(temp_filename, changelog_filename)
+        except BaseException:
+            # do not leave the partially written file in the repository,
+            # but always raise the original error
+            with suppress(OSError):
+                os.remove(temp_filename)
+            raise
 
     def _commit_changelog(self, commit_branch_name: str) -> None:
         """Commit Changelog"""
@@ -128,7 +149,7 @@ class ChangelogCIBase(abc.ABC):
         )
 
         if response.status_code == 201:
-            html_url = response.json()["html_url"]
+            html_url = json_loads(response.content)["html_url"]
             gha_utils.notice(f"Pull request opened at {html_url} \U0001F389")
         else:
             gha_utils.error(
@@ -182,9 +203,8 @@ class ChangelogCIBase(abc.ABC):
                 f"{self.action_env.repository}, status code: {response.status_code}"
             )
         else:
-            gha_utils.notice(
-                f"Comment added at {response.json()['html_url']} \U0001F389"
-            )
+            html_url = json_loads(response.content)["html_url"]
+            gha_utils.notice(f"Comment added at {html_url} \U0001F389")
 
     def run(self) -> None:
         """Entrypoint to the Changelog CI"""
@@ -222,20 +242,24 @@ class ChangelogCIBase(abc.ABC):
 class ChangelogCIPullRequestEvent(ChangelogCIBase):
     """Generates, commits and/or comments changelog for pull request events"""
 
-    def __init__(self, config: Configuration, action_env: ActionEnvironment) -> None:
-        super().__init__(config, action_env)
-        self._check_pull_request_title()
-
     @property
     def _commit_branch_name(self) -> str:
         """Get the name of the branch to commit the changelog to"""
         return self.action_env.pull_request_branch
 
+    def _pre_init_check(self) -> None:
+        """Check the pull request title before initializing"""
+        self._check_pull_request_title()
+
+    @property
+    def _pull_request_title(self) -> str:
+        """Get the pull request title from the event payload"""
+        return str(self.event_payload["pull_request"]["title"])
+
     def _get_release_version(self) -> str:
         """Get release version number from the pull request title or user Input"""
-        pull_request_title = self.event_payload["pull_request"]["title"]
         pattern = re.compile(self.config.version_regex)
-        match = pattern.search(pull_request_title)
+        match = pattern.search(self._pull_request_title)
 
         if match:
             return match.group()
@@ -264,9 +288,8 @@ class ChangelogCIPullRequestEvent(ChangelogCIBase):
 
     def _check_pull_request_title(self) -> None:
         """Check if changelog should be generated for this pull request"""
-        pull_request_title = self.event_payload["pull_request"]["title"]
         pattern = re.compile(self.config.pull_request_title_regex)
-        match = pattern.search(pull_request_title)
+        match = pattern.search(self._pull_request_title)
 
         if not match and not self.config.release_version:
             # if pull request regex doesn't match then exit
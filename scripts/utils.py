@@ -1,7 +1,16 @@
 from functools import lru_cache
+from typing import Any, TextIO
 
 import github_action_utils as gha_utils  # type: ignore
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson is a lot faster than the builtin json module
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 
 @lru_cache
@@ -15,13 +24,43 @@ def get_request_headers(github_token: str | None = None) -> dict[str, str]:
     return headers
 
 
+def get_request_session(github_token: str | None = None) -> requests.Session:
+    """Get a session for GitHub API requests that retries on server errors"""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        # GraphQL search queries are sent using POST
+        allowed_methods=["GET", "POST"],
+        # return the last response instead of raising an error
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update(get_request_headers(github_token))
+
+    return session
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Deserialize JSON data using orjson if it is installed"""
+    return _json_loads(data)
+
+
+def json_load(file: TextIO) -> Any:
+    """Deserialize JSON data from a file using orjson if it is installed"""
+    return json_loads(file.read())
+
+
 def display_whats_new() -> None:
     """function that prints what's new in Changelog CI Latest Version"""
     url = "https://api.github.com/repos/saadmk11/changelog-ci/releases/latest"
     response = requests.get(url)
 
     if response.status_code == 200:
-        response_data = response.json()
+        response_data = json_loads(response.content)
         latest_release_tag = response_data["tag_name"]
         latest_release_html_url = response_data["html_url"]
         latest_release_body = response_data["body"]
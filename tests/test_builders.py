@@ -0,0 +1,422 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+from scripts.builders import CommitMessageChangelogBuilder, PullRequestChangelogBuilder
+from scripts.config import ActionEnvironment, Configuration
+
+action_env = ActionEnvironment(
+    event_path="event.json",
+    repository="owner/repo",
+    pull_request_branch="release",
+    base_branch="main",
+    event_name="pull_request",
+    event_payload={},
+)
+
+
+def get_json_response(data: Any, status_code: int = 200) -> mock.Mock:
+    """Get a mocked GitHub API response with JSON content"""
+    response = mock.Mock(status_code=status_code, links={})
+    response.content = json.dumps(data).encode()
+    return response
+
+
+def get_etag_response(data: Any, etag: str) -> mock.Mock:
+    """Get a mocked GitHub API response with an `ETag` header"""
+    response = get_json_response(data)
+    response.headers = {"ETag": etag}
+    return response
+
+
+def get_search_response(
+    numbers: list[int], has_next_page: bool = False, cursor: str | None = None
+) -> mock.Mock:
+    """Get a mocked GraphQL search response for the given pull request numbers"""
+    nodes = [
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "url": f"https://github.com/owner/repo/pull/{number}",
+            "labels": {"nodes": [{"name": "bug"}]},
+        }
+        for number in numbers
+    ]
+    return get_json_response(
+        {
+            "data": {
+                "search": {
+                    "pageInfo": {"hasNextPage": has_next_page, "endCursor": cursor},
+                    "nodes": nodes,
+                }
+            }
+        }
+    )
+
+
+@mock.patch(
+    "scripts.builders.ChangelogBuilderBase._get_latest_release_date",
+    return_value="2022-01-01T00:00:00Z",
+)
+@mock.patch("scripts.builders.gha_utils")
+class TestPullRequestChangelogBuilderFetch(unittest.TestCase):
+    """Test fetching the pull requests of the PullRequestChangelogBuilder"""
+
+    def setUp(self):
+        self.builder = PullRequestChangelogBuilder(
+            Configuration(github_token="token"), action_env, "1.0.0"
+        )
+        self.builder._session = mock.Mock()
+
+    def test_get_changes_after_last_release_paginates(
+        self, gha_utils, _get_latest_release_date
+    ):
+        self.builder._session.post.side_effect = [
+            get_search_response([1, 2], has_next_page=True, cursor="page-2"),
+            get_search_response([3]),
+        ]
+
+        items = self.builder._get_changes_after_last_release()
+
+        self.assertEqual([item["number"] for item in items], [1, 2, 3])
+        self.assertEqual(items[0]["labels"], frozenset({"bug"}))
+        self.assertEqual(items[0]["url"], "https://github.com/owner/repo/pull/1")
+
+        variables = [
+            call.kwargs["json"]["variables"]
+            for call in self.builder._session.post.call_args_list
+        ]
+        self.assertEqual(
+            [variable["after"] for variable in variables], [None, "page-2"]
+        )
+        self.assertEqual(
+            variables[0]["q"],
+            "repo:owner/repo is:pr is:merged sort:created-asc "
+            "merged:>=2022-01-01T00:00:00Z",
+        )
+
+    def test_get_changes_after_last_release_page_error(
+        self, gha_utils, _get_latest_release_date
+    ):
+        self.builder._session.post.side_effect = [
+            get_search_response([1, 2], has_next_page=True, cursor="page-2"),
+            mock.Mock(status_code=502),
+        ]
+
+        with self.assertRaises(SystemExit) as context:
+            self.builder._get_changes_after_last_release()
+
+        self.assertEqual(context.exception.code, 1)
+        gha_utils.error.assert_called_once()
+
+    def test_get_changes_after_last_release_graphql_error(
+        self, gha_utils, _get_latest_release_date
+    ):
+        error_response = get_json_response({"errors": [{"message": "rate limited"}]})
+        self.builder._session.post.side_effect = [
+            get_search_response([1], has_next_page=True, cursor="page-2"),
+            error_response,
+        ]
+
+        with self.assertRaises(SystemExit) as context:
+            self.builder._get_changes_after_last_release()
+
+        self.assertEqual(context.exception.code, 1)
+
+    def test_get_changes_after_last_release_without_token(
+        self, gha_utils, _get_latest_release_date
+    ):
+        self.builder.config = Configuration()
+
+        with self.assertRaises(SystemExit) as context:
+            self.builder._get_changes_after_last_release()
+
+        self.assertEqual(context.exception.code, 1)
+        gha_utils.error.assert_called_once()
+        _get_latest_release_date.assert_not_called()
+        self.builder._session.post.assert_not_called()
+
+
+class TestPullRequestChangelogBuilderParse(unittest.TestCase):
+    """Test parsing the pull requests of the PullRequestChangelogBuilder"""
+
+    group_config = [
+        {"title": "Bug Fixes", "labels": ["bug", "bugfix"]},
+        {"title": "Documentation", "labels": ["docs", "bug"]},
+    ]
+    change_list = [
+        {"number": 1, "title": "Fix", "url": "url-1", "labels": frozenset({"bug"})},
+        {
+            "number": 2,
+            "title": "Docs and fix",
+            "url": "url-2",
+            "labels": frozenset({"docs", "bugfix"}),
+        },
+        {"number": 3, "title": "Docs", "url": "url-3", "labels": frozenset({"docs"})},
+        {"number": 4, "title": "Chore", "url": "url-4", "labels": frozenset()},
+        {
+            "number": 5,
+            "title": "Skipped",
+            "url": "url-5",
+            "labels": frozenset({"bug", "skip-changelog"}),
+        },
+    ]
+
+    def get_builder(self, **config_options: Any) -> PullRequestChangelogBuilder:
+        config = Configuration(
+            group_config=self.group_config,
+            exclude_labels=["skip-changelog"],
+            **config_options,
+        )
+        builder = PullRequestChangelogBuilder(config, action_env, "1.0.0")
+        builder.change_list = self.change_list
+        return builder
+
+    def test_parse_changelog_markdown(self):
+        self.assertEqual(
+            self.get_builder().parse_changelog("md"),
+            "# Version: 1.0.0\n\n"
+            "\n#### Bug Fixes\n\n"
+            "* [#1](url-1): Fix\n"
+            "* [#2](url-2): Docs and fix\n"
+            "\n#### Documentation\n\n"
+            "* [#3](url-3): Docs\n"
+            "\n#### Other Changes\n\n"
+            "* [#4](url-4): Chore\n",
+        )
+
+    def test_parse_changelog_restructuredtext(self):
+        self.assertEqual(
+            self.get_builder().parse_changelog("rst"),
+            "Version: 1.0.0\n==============\n\n"
+            "\nBug Fixes\n---------\n\n"
+            "* `#1 <url-1>`__: Fix\n"
+            "* `#2 <url-2>`__: Docs and fix\n"
+            "\nDocumentation\n-------------\n\n"
+            "* `#3 <url-3>`__: Docs\n"
+            "\nOther Changes\n-------------\n\n"
+            "* `#4 <url-4>`__: Chore\n",
+        )
+
+    def test_parse_changelog_without_unlabeled_changes(self):
+        self.assertEqual(
+            self.get_builder(include_unlabeled_changes=False).parse_changelog("md"),
+            "# Version: 1.0.0\n\n"
+            "\n#### Bug Fixes\n\n"
+            "* [#1](url-1): Fix\n"
+            "* [#2](url-2): Docs and fix\n"
+            "\n#### Documentation\n\n"
+            "* [#3](url-3): Docs\n",
+        )
+
+    def test_parse_changelog_without_group_config(self):
+        builder = self.get_builder()
+        builder.config = Configuration()
+
+        self.assertEqual(
+            builder.parse_changelog("md"),
+            "# Version: 1.0.0\n\n"
+            "* [#1](url-1): Fix\n"
+            "* [#2](url-2): Docs and fix\n"
+            "* [#3](url-3): Docs\n"
+            "* [#4](url-4): Chore\n"
+            "* [#5](url-5): Skipped\n",
+        )
+
+
+@mock.patch("scripts.builders.gha_utils")
+class TestChangelogBuilderResponseCache(unittest.TestCase):
+    """Test caching the GitHub API responses of the Changelog Builder"""
+
+    release_url = "https://api.github.com/repos/owner/repo/releases/latest"
+    release_data = {"published_at": "2022-01-01T00:00:00Z"}
+
+    def get_builder(self, **config_options: Any) -> CommitMessageChangelogBuilder:
+        builder = CommitMessageChangelogBuilder(
+            Configuration(**config_options), action_env, "1.0.0"
+        )
+        builder._session = mock.Mock()
+        return builder
+
+    def test_response_cache_disabled_by_default(self, gha_utils):
+        builder = self.get_builder()
+        builder._session.get.return_value = get_etag_response(
+            self.release_data, '"etag"'
+        )
+
+        with mock.patch("builtins.open") as open_mock:
+            self.assertEqual(builder._get_latest_release_date(), "2022-01-01T00:00:00Z")
+            builder._save_response_cache()
+
+        # the cache file is never read or written
+        open_mock.assert_not_called()
+        builder._session.get.assert_called_once_with(self.release_url, headers={})
+
+    def test_response_cache_reuses_not_modified_response(self, gha_utils):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, "cache.json")
+
+            builder = self.get_builder(response_cache_file=cache_file)
+            builder._session.get.return_value = get_etag_response(
+                self.release_data, '"etag"'
+            )
+            builder._get_latest_release_date()
+            # nothing is written until the cache is saved
+            self.assertFalse(os.path.exists(cache_file))
+            builder._save_response_cache()
+
+            with open(cache_file) as file:
+                self.assertEqual(
+                    json.load(file),
+                    {
+                        self.release_url: {
+                            "etag": '"etag"',
+                            "data": self.release_data,
+                            "next_url": None,
+                        }
+                    },
+                )
+
+            builder = self.get_builder(response_cache_file=cache_file)
+            builder._session.get.return_value = mock.Mock(status_code=304)
+
+            self.assertEqual(builder._get_latest_release_date(), "2022-01-01T00:00:00Z")
+            builder._session.get.assert_called_once_with(
+                self.release_url, headers={"If-None-Match": '"etag"'}
+            )
+
+    def test_response_cache_write_error(self, gha_utils):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, "missing-dir", "cache.json")
+
+            builder = self.get_builder(response_cache_file=cache_file)
+            builder._session.get.return_value = get_etag_response(
+                self.release_data, '"etag"'
+            )
+            builder._get_latest_release_date()
+            builder._save_response_cache()
+
+            self.assertFalse(os.path.exists(cache_file))
+            gha_utils.warning.assert_called_once()
+
+    def test_response_cache_with_invalid_data(self, gha_utils):
+        invalid_caches = [
+            [],
+            {self.release_url: []},
+            {self.release_url: {"data": self.release_data}},
+            {self.release_url: {"etag": '"etag"'}},
+        ]
+
+        for invalid_cache in invalid_caches:
+            with self.subTest(invalid_cache=invalid_cache):
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    cache_file = os.path.join(temp_dir, "cache.json")
+
+                    with open(cache_file, "w") as file:
+                        json.dump(invalid_cache, file)
+
+                    builder = self.get_builder(response_cache_file=cache_file)
+                    builder._session.get.return_value = get_etag_response(
+                        self.release_data, '"etag"'
+                    )
+
+                    self.assertEqual(
+                        builder._get_latest_release_date(), "2022-01-01T00:00:00Z"
+                    )
+                    # invalid entries are not used for conditional requests
+                    builder._session.get.assert_called_once_with(
+                        self.release_url, headers={}
+                    )
+
+
+@mock.patch("scripts.builders.gha_utils")
+class TestCommitMessageChangelogBuilderFetch(unittest.TestCase):
+    """Test fetching the commits of the CommitMessageChangelogBuilder"""
+
+    def setUp(self):
+        self.builder = CommitMessageChangelogBuilder(
+            Configuration(), action_env, "1.0.0"
+        )
+        self.builder._session = mock.Mock()
+
+    @staticmethod
+    def get_commits_response(
+        messages: list[str], next_url: str | None = None
+    ) -> mock.Mock:
+        response = get_json_response(
+            [
+                {
+                    "sha": f"{index:040d}",
+                    "html_url": f"url-{index}",
+                    "commit": {"message": message},
+                }
+                for index, message in enumerate(messages)
+            ]
+        )
+        response.headers = {}
+
+        if next_url:
+            response.links = {"next": {"url": next_url}}
+
+        return response
+
+    @mock.patch.object(
+        CommitMessageChangelogBuilder,
+        "_get_latest_release_date",
+        return_value="2022-01-01T00:00:00Z",
+    )
+    def test_get_changes_after_last_release_paginates(
+        self, _get_latest_release_date, gha_utils
+    ):
+        self.builder._session.get.side_effect = [
+            self.get_commits_response(["First", "Merge branch 'main'"], "page-2"),
+            self.get_commits_response(["Second"]),
+        ]
+
+        items = self.builder._get_changes_after_last_release()
+
+        self.assertEqual([item["message"] for item in items], ["First", "Second"])
+        self.assertEqual(
+            [call.args[0] for call in self.builder._session.get.call_args_list],
+            [
+                "https://api.github.com/repos/owner/repo/commits"
+                "?per_page=100&since=2022-01-01T00%3A00%3A00Z",
+                "page-2",
+            ],
+        )
+
+    @mock.patch.object(
+        CommitMessageChangelogBuilder, "_get_latest_release_date", return_value=""
+    )
+    def test_get_changes_without_release_uses_first_page(
+        self, _get_latest_release_date, gha_utils
+    ):
+        self.builder._session.get.side_effect = [
+            self.get_commits_response(["First"], "page-2"),
+        ]
+
+        items = self.builder._get_changes_after_last_release()
+
+        self.assertEqual([item["message"] for item in items], ["First"])
+        self.builder._session.get.assert_called_once()
+
+    @mock.patch.object(
+        CommitMessageChangelogBuilder,
+        "_get_latest_release_date",
+        return_value="2022-01-01T00:00:00Z",
+    )
+    def test_get_changes_after_last_release_page_error(
+        self, _get_latest_release_date, gha_utils
+    ):
+        self.builder._session.get.side_effect = [
+            self.get_commits_response(["First"], "page-2"),
+            get_json_response({}, status_code=502),
+        ]
+
+        with self.assertRaises(SystemExit) as context:
+            self.builder._get_changes_after_last_release()
+
+        self.assertEqual(context.exception.code, 1)
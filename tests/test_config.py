@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest import mock
 
@@ -55,6 +57,7 @@ class TestConfiguration(unittest.TestCase):
         )
         self.assertIsNone(config.release_version)
         self.assertIsNone(config.github_token)
+        self.assertIsNone(config.response_cache_file)
         self.assertEqual(config.changelog_file_type, MARKDOWN_FILE)
 
     @mock.patch(
@@ -203,6 +206,7 @@ class TestConfiguration(unittest.TestCase):
                 "git_committer_username": "changelog-ci",
                 "github_token": "12345",
                 "release_version": "1.0.0",
+                "response_cache_file": None,
             },
         )
 
@@ -223,6 +227,7 @@ class TestConfiguration(unittest.TestCase):
                 "git_committer_username": "changelog-ci",
                 "github_token": "12345",
                 "release_version": "1.0.0",
+                "response_cache_file": None,
                 "changelog_type": "commit_message",
                 "header_prefix": "Release:",
             },
@@ -303,6 +308,15 @@ class TestConfiguration(unittest.TestCase):
         self.assertIsNone(Configuration.clean_release_version(1.1))
         self.assertIsNone(Configuration.clean_release_version(True))
 
+    def test_clean_response_cache_file(self, gha_utils):
+        self.assertEqual(
+            Configuration.clean_response_cache_file(".changelog-ci-cache.json"),
+            ".changelog-ci-cache.json",
+        )
+
+        self.assertIsNone(Configuration.clean_response_cache_file(""))
+        self.assertIsNone(Configuration.clean_response_cache_file(True))
+
     def test_clean_group_config(self, gha_utils):
         group_config = [
             {"title": "Bug Fixes", "labels": ["bug", "bugfix"]},
@@ -337,3 +351,40 @@ class TestConfiguration(unittest.TestCase):
 
         self.assertEqual(Configuration.clean_exclude_labels("test"), [])
         self.assertEqual(Configuration.clean_exclude_labels({"title": "test"}), [])
+
+    def test_get_config_file_data(self, gha_utils):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_config_path = os.path.join(temp_dir, "config.json")
+            yaml_config_path = os.path.join(temp_dir, "config.yaml")
+
+            with open(json_config_path, "w") as file:
+                file.write('{"header_prefix": "Release:"}')
+
+            with open(yaml_config_path, "w") as file:
+                file.write("header_prefix: 'Release:'")
+
+            self.assertEqual(
+                Configuration.get_config_file_data(json_config_path),
+                {"header_prefix": "Release:"},
+            )
+            self.assertEqual(
+                Configuration.get_config_file_data(yaml_config_path),
+                {"header_prefix": "Release:"},
+            )
+
+            with open(json_config_path, "w") as file:
+                file.write("{invalid json")
+
+            self.assertEqual(Configuration.get_config_file_data(json_config_path), {})
+            self.assertEqual(
+                Configuration.get_config_file_data(
+                    os.path.join(temp_dir, "missing.json")
+                ),
+                {},
+            )
+            self.assertEqual(
+                Configuration.get_config_file_data(
+                    os.path.join(temp_dir, "config.txt")
+                ),
+                {},
+            )
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from scripts.config import ActionEnvironment, Configuration
+from scripts.main import ChangelogCICustomEvent, ChangelogCIPullRequestEvent
+
+
+def get_action_env(pull_request_title: str) -> ActionEnvironment:
+    return ActionEnvironment(
+        event_path="event.json",
+        repository="owner/repo",
+        pull_request_branch="release",
+        base_branch="main",
+        event_name="pull_request",
+        event_payload={"number": 1, "pull_request": {"title": pull_request_title}},
+    )
+
+
+@mock.patch("scripts.main.gha_utils")
+class TestChangelogCIPullRequestEvent(unittest.TestCase):
+    """Test initializing the Changelog CI for pull request events"""
+
+    def test_release_pull_request(self, gha_utils):
+        changelog_ci = ChangelogCIPullRequestEvent(
+            Configuration(), get_action_env("Release v1.2.3")
+        )
+
+        self.assertEqual(changelog_ci.release_version, "v1.2.3")
+
+    @mock.patch.object(ChangelogCIPullRequestEvent, "_get_changelog_builder")
+    @mock.patch.object(ChangelogCIPullRequestEvent, "_get_release_version")
+    def test_not_release_pull_request(
+        self, _get_release_version, _get_changelog_builder, gha_utils
+    ):
+        with self.assertRaises(SystemExit) as context:
+            ChangelogCIPullRequestEvent(Configuration(), get_action_env("Fix bug"))
+
+        self.assertEqual(context.exception.code, 0)
+        # exits before anything else is prepared
+        _get_release_version.assert_not_called()
+        _get_changelog_builder.assert_not_called()
+
+
+class TestChangelogCIUpdateChangelogFile(unittest.TestCase):
+    """Test writing the changelog file of the Changelog CI"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.changelog_filename = os.path.join(self.temp_dir.name, "CHANGELOG.md")
+
+        self.changelog_ci = ChangelogCICustomEvent.__new__(ChangelogCICustomEvent)
+        self.changelog_ci.config = Configuration(
+            changelog_filename=self.changelog_filename
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_changelog(self) -> str:
+        with open(self.changelog_filename) as file:
+            return file.read()
+
+    def test_update_changelog_file_creates_file(self):
+        self.changelog_ci._update_changelog_file("# Version: 1.0.0\n")
+
+        self.assertEqual(self.read_changelog(), "# Version: 1.0.0\n")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["CHANGELOG.md"])
+
+    def test_update_changelog_file_prepends_changelog(self):
+        with open(self.changelog_filename, "w") as file:
+            file.write("# Version: 1.0.0\n" * 10)
+
+        # use a small chunk size to copy the existing data in multiple chunks
+        with mock.patch.object(ChangelogCICustomEvent, "FILE_CHUNK_SIZE", 16):
+            self.changelog_ci._update_changelog_file("# Version: 2.0.0\n")
+
+        self.assertEqual(
+            self.read_changelog(),
+            "# Version: 2.0.0\n\n\n" + "# Version: 1.0.0\n" * 10,
+        )
+        self.assertEqual(os.listdir(self.temp_dir.name), ["CHANGELOG.md"])
+
+    def test_update_changelog_file_with_empty_file(self):
+        open(self.changelog_filename, "w").close()
+
+        self.changelog_ci._update_changelog_file("# Version: 1.0.0\n")
+
+        self.assertEqual(self.read_changelog(), "# Version: 1.0.0\n")
+
+    def test_update_changelog_file_error_keeps_changelog(self):
+        with open(self.changelog_filename, "w") as file:
+            file.write("# Version: 1.0.0\n")
+
+        with mock.patch.object(shutil, "copymode", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.changelog_ci._update_changelog_file("# Version: 2.0.0\n")
+
+        self.assertEqual(self.read_changelog(), "# Version: 1.0.0\n")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["CHANGELOG.md"])